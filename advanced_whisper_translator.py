@@ -1,21 +1,137 @@
 """
 Advanced Real-time Speech-to-Speech Translation System
-Uses OpenAI Whisper for improved accuracy and Deep Translator for better translations
+Uses faster-whisper (CTranslate2) for fast, accurate recognition and async HTTP for translation/TTS
 """
 
-import whisper
-from deep_translator import GoogleTranslator
-from gtts import gTTS
+import aiohttp
+import asyncio
+import io
 import os
-import tempfile
-import pygame
+import re
+import sqlite3
 import threading
 import queue
 import time
 import numpy as np
-import sounddevice as sd
-from scipy.io.wavfile import write
-from collections import deque
+from collections import OrderedDict
+
+# faster-whisper/ctranslate2, pygame and sounddevice are imported lazily in
+# the methods that need them — importing this module stays cheap
+
+from config import AdvancedConfig
+
+# Google's public translate / TTS endpoints, called directly over a pooled session
+TRANSLATE_URL = 'https://translate.googleapis.com/translate_a/single'
+TTS_URL = 'https://translate.google.com/translate_tts'
+
+# Base query parameters memoized per language pair, built once per pair
+_translate_params = {}
+_tts_params = {}
+
+
+def _get_translate_params(source_lang, target_lang):
+    """Memoized base parameters for the translate endpoint"""
+    return _translate_params.setdefault(
+        (source_lang, target_lang),
+        {'client': 'gtx', 'sl': source_lang, 'tl': target_lang, 'dt': 't'}
+    )
+
+
+def _get_tts_params(target_lang):
+    """Memoized base parameters for the TTS endpoint"""
+    return _tts_params.setdefault(
+        target_lang,
+        {'ie': 'UTF-8', 'client': 'tw-ob', 'tl': target_lang}
+    )
+
+
+def to_whisper_input(pcm, sample_rate):
+    """
+    Normalize arbitrary PCM to the 16 kHz mono float32 Whisper expects,
+    fusing mono downmix, dtype scaling and polyphase resampling into one
+    traversal instead of three separately allocated passes.
+    """
+    # Scale int16 before any downmix — mean() promotes to float32 and
+    # would otherwise leave stereo int16 input unscaled at ±32768
+    if pcm.dtype == np.int16:
+        pcm = pcm.astype(np.float32) * (1.0 / 32768.0)
+    if pcm.ndim == 2:
+        pcm = pcm.mean(axis=1, dtype=np.float32)
+    else:
+        pcm = pcm.astype(np.float32, copy=False)
+    if sample_rate != 16000:
+        from scipy.signal import resample_poly
+
+        pcm = resample_poly(pcm, 16000, sample_rate).astype(np.float32, copy=False)
+    return pcm
+
+# Bounded LRU translation cache (plain OrderedDict — the async stage
+# can't go through functools.lru_cache), backed by an on-disk sqlite
+# cache so repeated phrases survive restarts
+_translation_cache = OrderedDict()
+
+_CACHE_DB_PATH = os.path.expanduser('~/.rt_translator_cache.sqlite')
+_COMMIT_EVERY = 8
+_cache_db = None
+_pending_inserts = 0
+
+
+def _cache_db_conn():
+    """Open the on-disk translation cache once, creating it if needed"""
+    global _cache_db
+    if _cache_db is None:
+        _cache_db = sqlite3.connect(_CACHE_DB_PATH, check_same_thread=False)
+        _cache_db.execute(
+            'CREATE TABLE IF NOT EXISTS translations ('
+            'src TEXT, tgt TEXT, text TEXT, translation TEXT, '
+            'PRIMARY KEY (src, tgt, text))'
+        )
+    return _cache_db
+
+
+def _cache_put_memory(key, value):
+    """Store a translation in memory, evicting least-recently-used entries"""
+    _translation_cache[key] = value
+    _translation_cache.move_to_end(key)
+    while len(_translation_cache) > AdvancedConfig.CACHE_SIZE:
+        _translation_cache.popitem(last=False)
+
+
+def _cache_get(key):
+    """In-memory LRU first, then the disk cache; None on a true miss"""
+    try:
+        _translation_cache.move_to_end(key)
+        return _translation_cache[key]
+    except KeyError:
+        pass
+
+    row = _cache_db_conn().execute(
+        'SELECT translation FROM translations WHERE src=? AND tgt=? AND text=?',
+        key
+    ).fetchone()
+    if row is None:
+        return None
+
+    # Warm the in-memory layer so the next hit skips the DB too
+    _cache_put_memory(key, row[0])
+    return row[0]
+
+
+def _cache_put(key, value):
+    """Store a translation in memory and on disk (batched commits)"""
+    global _pending_inserts
+
+    _cache_put_memory(key, value)
+
+    db = _cache_db_conn()
+    db.execute(
+        'INSERT OR IGNORE INTO translations VALUES (?, ?, ?, ?)',
+        (*key, value)
+    )
+    _pending_inserts += 1
+    if _pending_inserts >= _COMMIT_EVERY:
+        db.commit()
+        _pending_inserts = 0
 
 
 class WhisperRealtimeTranslator:
@@ -37,179 +153,398 @@ class WhisperRealtimeTranslator:
                              - base: Good balance (recommended)
                              - small: Better accuracy
                              - medium/large: Best accuracy, slower
-            chunk_duration (int): Seconds of audio per chunk
+            chunk_duration (int): Seconds between window emissions (hop size)
             sample_rate (int): Audio sample rate (16000 recommended for Whisper)
         """
         self.source_lang = source_lang
         self.target_lang = target_lang
+        self.model_size = model_size
         self.chunk_duration = chunk_duration
         self.sample_rate = sample_rate
-        
-        # Load Whisper model
-        print(f"🤖 Loading Whisper '{model_size}' model... (This may take a minute)")
-        self.whisper_model = whisper.load_model(model_size)
+
+        # Deferred heavy imports: pulling these in at module load costs
+        # seconds and hundreds of MB even for --help
+        import ctranslate2
+        import pygame
+        from faster_whisper import WhisperModel, BatchedInferencePipeline
+        from faster_whisper.vad import VadOptions
+
+        # Pick the fastest numeric type for the hardware: float16 tensor-core
+        # GEMMs on CUDA, int8 quantized kernels on CPU
+        if ctranslate2.get_cuda_device_count() > 0:
+            self.device = 'cuda'
+            self.compute_type = 'float16'
+        else:
+            self.device = 'cpu'
+            self.compute_type = 'int8'
+
+        # Load Whisper model (CTranslate2 backend)
+        print(f"🤖 Loading Whisper '{model_size}' model on {self.device} "
+              f"({self.compute_type})... (This may take a minute)")
+        self.whisper_model = WhisperModel(
+            model_size,
+            device=self.device,
+            compute_type=self.compute_type,
+            cpu_threads=os.cpu_count()
+        )
         print("✅ Whisper model loaded!")
-        
-        # Initialize translator
-        self.translator = GoogleTranslator(source=source_lang, target=target_lang)
-        
-        # Initialize pygame for audio playback
+
+        # Batched pipeline amortizes launch overhead across queued chunks
+        self.whisper_pipeline = BatchedInferencePipeline(model=self.whisper_model)
+        self.batch_size = 8
+
+        # How many pending transcripts one translate pass will drain
+        self.translate_batch_size = 8
+
+        # Transcription options never change once the pair is fixed; build
+        # them one time instead of revalidating keyword defaults per chunk.
+        # (The mel filterbank itself is already precomputed inside the
+        # CTranslate2 feature extractor at model load.)
+        self._transcribe_opts = {
+            'language': source_lang,
+            'batch_size': self.batch_size,
+            'beam_size': 1,  # greedy decode — 5x cheaper than the default beam
+        }
+
+        # Silero VAD gates chunks before they reach Whisper (~1ms vs a full forward pass)
+        self.vad_options = VadOptions()
+
+        # Initialize pygame for audio playback; one persistent channel is
+        # reused for every utterance so SDL_mixer setup isn't paid per phrase
         pygame.mixer.init()
+        self._channel = pygame.mixer.Channel(0)
         
-        # Queues for pipeline stages
-        self.audio_queue = queue.Queue()
-        self.text_queue = queue.Queue()
-        self.translation_queue = queue.Queue()
-        
-        # Translation cache to avoid re-translating same phrases
-        self.translation_cache = {}
+        # Stage 1 -> 2 handoff stays a thread queue — kept short with
+        # drop-oldest so the stream stays real-time when Whisper lags
+        self.audio_queue = queue.Queue(maxsize=4)
+
+        # Chunks dropped because transcription fell behind
+        self.dropped_chunks = 0
+
+        # Stages 3 and 4 share one asyncio loop (see _network_pipeline);
+        # their queues are created once that loop starts
+        self._loop = None
+        self._async_text_queue = None
+        self._async_translation_queue = None
         
         # Control flags
         self.is_running = False
         self.is_recording = False
+
+        # Utterance buffer capped at Whisper's 30s training context.
+        # Preallocated int16 ring matching the raw mic format: the callback
+        # does one memcpy per block, and the int16 -> float32 conversion
+        # happens once per emitted utterance rather than per callback.
+        self.window_duration = 30
+        self._ring_size = int(sample_rate * self.window_duration)
+        self._ring = np.empty(self._ring_size, dtype=np.int16)
+        self._widx = 0       # next write position in the ring
+        self._filled = 0     # valid samples, saturates at ring size
+        self._window_scratch = np.empty(self._ring_size, dtype=np.int16)
+
+        # Silence-driven emission: the callback pushes an utterance as soon
+        # as it hears enough quiet, instead of waiting for a fixed tick
+        self._silence_threshold = int(0.01 * 32768)  # int16 domain
+        self._silence_samples = 0
+
+        # Preallocated scratch for the per-block |x| silence check, so the
+        # callback's detector is a pure ufunc pass with no allocations
+        self._block_size = 1024
+        self._abs_scratch = np.empty(self._block_size, dtype=np.int16)
+        self._min_silence_samples = int(0.5 * sample_rate)
+        self._min_speech_samples = int(0.5 * sample_rate)
+        self._stop_event = threading.Event()
         
-        # Audio buffer
-        self.audio_buffer = deque(maxlen=int(sample_rate * chunk_duration))
-        
+    def _snapshot_window(self):
+        """
+        Copy the ring buffer contents into chronological order.
+        Returns an int16 view of the scratch buffer, or None if empty.
+        """
+        n = self._filled
+        if n == 0:
+            return None
+        start = (self._widx - n) % self._ring_size
+        if start + n <= self._ring_size:
+            self._window_scratch[:n] = self._ring[start:start + n]
+        else:
+            first = self._ring_size - start
+            self._window_scratch[:first] = self._ring[start:]
+            self._window_scratch[first:n] = self._ring[:n - first]
+        return self._window_scratch[:n]
+
     def record_audio_chunk(self):
         """
         Stage 1: LISTENING
         Record audio continuously in chunks using sounddevice
         """
+        import sounddevice as sd
+
         print(f"\n🎤 Listening in {self.source_lang.upper()}... Speak now!\n")
         
         def audio_callback(indata, frames, time_info, status):
-            """Callback for audio stream"""
+            """Callback for audio stream (raw int16 blocks)"""
             if status:
                 print(f"⚠️  Audio status: {status}")
-            
-            # Add audio to buffer
-            self.audio_buffer.extend(indata[:, 0])
-        
-        # Start audio stream
-        with sd.InputStream(samplerate=self.sample_rate, 
-                           channels=1, 
-                           callback=audio_callback,
-                           dtype='float32'):
-            
-            while self.is_running:
-                time.sleep(self.chunk_duration)
-                
-                if len(self.audio_buffer) > 0:
-                    # Convert buffer to numpy array
-                    audio_chunk = np.array(list(self.audio_buffer))
-                    
-                    # Check if there's actual speech (not just silence)
-                    if np.abs(audio_chunk).max() > 0.01:  # Threshold for silence
-                        print("📝 Audio chunk captured")
-                        self.audio_queue.put(audio_chunk.copy())
-                    
-                    # Clear buffer for next chunk
-                    self.audio_buffer.clear()
+
+            # Raw int16 straight off the driver — half the bandwidth of a
+            # float32 stream, and no per-callback dtype conversion
+            samples = np.frombuffer(indata, dtype=np.int16)
+            n = len(samples)
+            end = self._widx + n
+            if end <= self._ring_size:
+                self._ring[self._widx:end] = samples
+            else:
+                first = self._ring_size - self._widx
+                self._ring[self._widx:] = samples[:first]
+                self._ring[:n - first] = samples[first:]
+            self._widx = end % self._ring_size
+            self._filled = min(self._filled + n, self._ring_size)
+
+            # Track trailing silence; an utterance ends once enough quiet
+            # follows enough buffered speech. |x| goes through a preallocated
+            # scratch so the check allocates nothing per block.
+            scratch = self._abs_scratch[:n]
+            np.abs(samples, out=scratch)
+            if float(scratch.mean()) < self._silence_threshold:
+                self._silence_samples += n
+            else:
+                self._silence_samples = 0
+
+            if (self._silence_samples >= self._min_silence_samples
+                    and self._filled - self._silence_samples >= self._min_speech_samples):
+                self._emit_utterance()
+
+        # Start audio stream — the callback drives emission, this thread
+        # just holds the stream open until shutdown
+        with sd.RawInputStream(samplerate=self.sample_rate,
+                              channels=1,
+                              dtype='int16',
+                              blocksize=self._block_size,
+                              callback=audio_callback):
+            self._stop_event.wait()
     
+    def _emit_utterance(self):
+        """
+        Called from the audio callback once an utterance ends: snapshot the
+        buffered samples, queue them for transcription, and reset the
+        buffer. The float conversion and VAD trim happen on the transcribe
+        thread — the callback stays memcpy + counter, so Silero's lazy
+        ONNX-session load can never stall the audio stream.
+        """
+        audio_chunk = self._snapshot_window()
+        self._filled = 0
+        self._silence_samples = 0
+        if audio_chunk is None:
+            return
+
+        print("📝 Utterance captured")
+        chunk = audio_chunk.copy()  # the scratch is reused by the next snapshot
+        try:
+            self.audio_queue.put_nowait(chunk)
+        except queue.Full:
+            # Drop the oldest chunk so the stream stays real-time
+            try:
+                self.audio_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.audio_queue.put_nowait(chunk)
+            self.dropped_chunks += 1
+            print(f"⚠️  Transcription behind, dropped oldest chunk "
+                  f"({self.dropped_chunks} total)")
+
     def transcribe_audio(self):
         """
         Stage 2: UNDERSTANDING
         Transcribe audio to text using Whisper
         """
+        from faster_whisper.vad import get_speech_timestamps
+
         while self.is_running:
             try:
-                # Get audio chunk
-                audio_chunk = self.audio_queue.get(timeout=1)
-                
-                print("🧠 Transcribing with Whisper...")
-                
-                # Transcribe using Whisper
-                result = self.whisper_model.transcribe(
-                    audio_chunk,
-                    language=self.source_lang,
-                    fp16=False,  # Use fp32 for CPU
-                    verbose=False
-                )
-                
-                text = result['text'].strip()
-                
-                if text:
-                    print(f"📄 Transcribed: '{text}'")
-                    self.text_queue.put(text)
-                else:
-                    print("⚠️  No speech detected in chunk")
-                
+                # Block for the first chunk, then drain whatever else is waiting
+                chunks = [self.audio_queue.get(timeout=1)]
             except queue.Empty:
                 continue
+
+            while len(chunks) < self.batch_size:
+                try:
+                    chunks.append(self.audio_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                print(f"🧠 Transcribing {len(chunks)} chunk(s) with Whisper...")
+
+                for audio_chunk in chunks:
+                    # Normalize (int16 -> float32; resample if needed) and
+                    # VAD-trim here, off the audio thread
+                    audio_chunk = to_whisper_input(audio_chunk, self.sample_rate)
+                    speech_spans = get_speech_timestamps(audio_chunk, self.vad_options)
+                    if not speech_spans:
+                        print("⚠️  No speech detected in chunk")
+                        continue
+                    audio_chunk = audio_chunk[
+                        speech_spans[0]['start']:speech_spans[-1]['end']
+                    ]
+
+                    # Batched pipeline runs the VAD segments of each chunk as one GEMM batch
+                    segments, info = self.whisper_pipeline.transcribe(
+                        audio_chunk, **self._transcribe_opts
+                    )
+
+                    text = ' '.join(segment.text.strip() for segment in segments).strip()
+
+                    if text:
+                        print(f"📄 Transcribed: '{text}'")
+                        self._submit_text(text)
+                    else:
+                        print("⚠️  No speech detected in chunk")
+
             except Exception as e:
                 print(f"❌ Transcription error: {e}")
     
-    def translate_text(self):
+    def _submit_text(self, text):
+        """Hand transcribed text to the asyncio stages from a plain thread"""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._enqueue_text, text)
+
+    def _enqueue_text(self, text):
+        """Runs on the event loop; drops text if translation is saturated"""
+        try:
+            self._async_text_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            print("⚠️  Translation backlog full, dropping text")
+
+    def _run_network_pipeline(self):
+        """Thread entry point hosting the asyncio translate/speak stages"""
+        asyncio.run(self._network_pipeline())
+
+    async def _network_pipeline(self):
+        """
+        Stages 3 + 4 on a single event loop. One pooled aiohttp session
+        (keep-alive, 4 connections) serves both translation and TTS, so
+        several phrases can be in flight while earlier ones still play.
+        """
+        self._async_text_queue = asyncio.Queue(maxsize=AdvancedConfig.MAX_QUEUE_SIZE)
+        self._async_translation_queue = asyncio.Queue(maxsize=AdvancedConfig.MAX_QUEUE_SIZE)
+        self._loop = asyncio.get_running_loop()
+
+        connector = aiohttp.TCPConnector(limit=4, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            await asyncio.gather(
+                self._translate_loop(session),
+                self._speak_loop(session),
+            )
+
+    async def _translate_async(self, session, text):
+        """Translate one phrase via the translate endpoint"""
+        params = {**_get_translate_params(self.source_lang, self.target_lang),
+                  'q': text}
+        async with session.get(TRANSLATE_URL, params=params) as resp:
+            resp.raise_for_status()
+            data = await resp.json(content_type=None)
+        return ''.join(part[0] for part in data[0] if part[0])
+
+    async def _fetch_tts(self, session, text):
+        """Fetch synthesized MP3 bytes for one phrase"""
+        params = {**_get_tts_params(self.target_lang), 'q': text}
+        async with session.get(TTS_URL, params=params) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+    async def _translate_loop(self, session):
         """
         Stage 3: TRANSLATING
-        Translate text using Deep Translator with caching
+        Drain pending transcripts and translate the batch concurrently,
+        amortizing request overhead when speech backs up
         """
         while self.is_running:
             try:
-                # Get text
-                text = self.text_queue.get(timeout=1)
-                
-                # Check cache first
-                if text in self.translation_cache:
-                    translated_text = self.translation_cache[text]
-                    print(f"💾 From cache: '{translated_text}'")
-                else:
-                    print(f"🌍 Translating to {self.target_lang.upper()}...")
-                    
-                    # Translate
-                    translated_text = self.translator.translate(text)
-                    
-                    # Cache the translation
-                    self.translation_cache[text] = translated_text
-                    
-                    print(f"✅ Translation: '{translated_text}'")
-                
-                self.translation_queue.put(translated_text)
-                
-            except queue.Empty:
+                texts = [await asyncio.wait_for(self._async_text_queue.get(), timeout=1)]
+            except asyncio.TimeoutError:
                 continue
+
+            while len(texts) < self.translate_batch_size:
+                try:
+                    texts.append(self._async_text_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            try:
+                keys = [(self.source_lang, self.target_lang, t) for t in texts]
+                results = [_cache_get(key) for key in keys]
+
+                # Only cache misses hit the network, all in flight at once
+                misses = [i for i, r in enumerate(results) if r is None]
+                if misses:
+                    print(f"🌍 Translating {len(misses)} phrase(s) "
+                          f"to {self.target_lang.upper()}...")
+                    fetched = await asyncio.gather(
+                        *[self._translate_async(session, texts[i]) for i in misses]
+                    )
+                    for i, translated in zip(misses, fetched):
+                        results[i] = translated
+                        _cache_put(keys[i], translated)
+
+                for translated_text in results:
+                    print(f"✅ Translation: '{translated_text}'")
+                    await self._async_translation_queue.put(translated_text)
+
             except Exception as e:
                 print(f"❌ Translation error: {e}")
-    
-    def speak_translation(self):
+
+    async def _speak_loop(self, session):
         """
         Stage 4: SPEAKING
-        Convert translated text to speech and play it
+        Fetch TTS audio asynchronously and play it
         """
-        while self.is_running or not self.translation_queue.empty():
+        while self.is_running or not self._async_translation_queue.empty():
+            try:
+                text = await asyncio.wait_for(
+                    self._async_translation_queue.get(), timeout=1
+                )
+            except asyncio.TimeoutError:
+                continue
+
             try:
-                # Get translated text
-                text = self.translation_queue.get(timeout=1)
-                
                 print(f"🔊 Speaking: '{text}'")
-                
-                # Generate speech
-                tts = gTTS(text=text, lang=self.target_lang, slow=False)
-                
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                    temp_file = fp.name
-                    tts.save(temp_file)
-                
-                # Play audio
-                pygame.mixer.music.load(temp_file)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                
-                # Clean up
-                pygame.mixer.music.unload()
-                os.unlink(temp_file)
-                
+
+                # Synthesize per sentence and start all fetches up front, so
+                # later sentences download while the first one is playing
+                parts = [p for p in re.split(r'(?<=[.!?])\s+', text) if p]
+                fetches = [
+                    asyncio.create_task(self._fetch_tts(session, part))
+                    for part in parts
+                ]
+
+                for fetch in fetches:
+                    mp3_bytes = await fetch
+                    # Play straight from memory in a worker thread — no temp
+                    # file, no write/unlink round-trip per utterance
+                    await asyncio.to_thread(self._play_mp3, mp3_bytes)
+
                 print("✅ Speech complete\n")
-                
-            except queue.Empty:
-                continue
+
             except Exception as e:
                 print(f"❌ Speech error: {e}")
+
+    def _play_mp3(self, mp3_bytes):
+        """Hand MP3 bytes to the persistent playback channel"""
+        import pygame
+
+        sound = pygame.mixer.Sound(io.BytesIO(mp3_bytes))
+
+        # Wait only until the channel's single queue slot frees up, then
+        # queue behind the playing sound — playback stays gapless and the
+        # next sentence can already be synthesized meanwhile
+        while self._channel.get_busy() and self._channel.get_queue() is not None:
+            pygame.time.wait(10)
+
+        if self._channel.get_busy():
+            self._channel.queue(sound)
+        else:
+            self._channel.play(sound)
     
     def start(self):
         """Start the advanced translation system"""
@@ -218,20 +553,21 @@ class WhisperRealtimeTranslator:
         print("="*70)
         print(f"Source Language: {self.source_lang.upper()}")
         print(f"Target Language: {self.target_lang.upper()}")
-        print(f"Model: Whisper ({self.whisper_model.__class__.__name__})")
+        print(f"Model: Whisper '{self.model_size}' "
+              f"(faster-whisper, {self.device}/{self.compute_type})")
         print(f"Chunk Duration: {self.chunk_duration}s")
         print(f"Sample Rate: {self.sample_rate} Hz")
         print("="*70)
         print("\n⚡ Starting advanced translation pipeline...\n")
         
         self.is_running = True
-        
+        self._stop_event.clear()
+
         # Create pipeline threads
         threads = [
             threading.Thread(target=self.record_audio_chunk, name="Recorder", daemon=True),
             threading.Thread(target=self.transcribe_audio, name="Whisper", daemon=True),
-            threading.Thread(target=self.translate_text, name="Translator", daemon=True),
-            threading.Thread(target=self.speak_translation, name="Speaker", daemon=True)
+            threading.Thread(target=self._run_network_pipeline, name="NetworkPipeline", daemon=True)
         ]
         
         # Start all threads
@@ -241,14 +577,13 @@ class WhisperRealtimeTranslator:
         
         print("\n🎯 System ready! Start speaking...\n")
         print("💡 Press Ctrl+C to stop\n")
-        print(f"📊 Translation cache: {len(self.translation_cache)} entries\n")
-        
+
         try:
             while True:
                 time.sleep(5)
                 # Periodically show cache size
-                if len(self.translation_cache) > 0:
-                    print(f"💾 Cache: {len(self.translation_cache)} translations stored")
+                if _translation_cache:
+                    print(f"💾 Cache: {len(_translation_cache)} translations stored")
                 
         except KeyboardInterrupt:
             print("\n\n🛑 Stopping translation system...")
@@ -257,12 +592,19 @@ class WhisperRealtimeTranslator:
     def stop(self):
         """Stop the translation system"""
         self.is_running = False
-        
+        self._stop_event.set()
+
         print("⏳ Processing remaining items...")
         time.sleep(2)
         
+        # Flush any translations still waiting on a batched commit
+        if _cache_db is not None:
+            _cache_db.commit()
+
         print(f"✅ Translation system stopped")
-        print(f"📊 Final cache size: {len(self.translation_cache)} translations")
+        print(f"📊 Final cache size: {len(_translation_cache)} translations")
+        if self.dropped_chunks:
+            print(f"📊 Dropped audio chunks: {self.dropped_chunks}")
         print("\n" + "="*70)
 
 
@@ -3,16 +3,59 @@ GUI Real-time Speech Translator
 Simple graphical interface for the translation system
 """
 
+import re
 import tkinter as tk
 from tkinter import ttk, scrolledtext
-import speech_recognition as sr
-from googletrans import Translator
-from gtts import gTTS
-import pygame
 import threading
 import queue
-import tempfile
-import os
+
+# speech_recognition, transformers and pyttsx3 are imported lazily the
+# first time translation starts — the window opens without loading them
+
+# MarianMT models cached per language pair so each pair loads exactly once
+_marian_models = {}
+
+
+def _get_marian(source_lang, target_lang):
+    """
+    Load (once) the MarianMT tokenizer/model for a language pair.
+    Raises LookupError if no model exists for the pair.
+    """
+    key = (source_lang, target_lang)
+    if key not in _marian_models:
+        import torch
+        from torch import nn
+        from transformers import MarianMTModel, MarianTokenizer
+
+        # Marian pair names use bare ISO codes ('zh', never 'zh-CN')
+        src = source_lang.split('-')[0]
+        tgt = target_lang.split('-')[0]
+        name = f"Helsinki-NLP/opus-mt-{src}-{tgt}"
+        try:
+            tokenizer = MarianTokenizer.from_pretrained(name)
+            model = MarianMTModel.from_pretrained(name).eval()
+        except (OSError, ValueError) as e:
+            raise LookupError(
+                f"No local translation model for {src} → {tgt} (tried '{name}')"
+            ) from e
+
+        # Dynamic int8 quantization keeps CPU latency in the 50-200ms range
+        model = torch.quantization.quantize_dynamic(
+            model, {nn.Linear}, dtype=torch.qint8
+        )
+        _marian_models[key] = (tokenizer, model)
+    return _marian_models[key]
+
+
+def _translate_local(source_lang, target_lang, text):
+    """Translate on-device with MarianMT — no network round-trip"""
+    import torch
+
+    tokenizer, model = _get_marian(source_lang, target_lang)
+    batch = tokenizer([text], return_tensors="pt", padding=True)
+    with torch.no_grad():
+        generated = model.generate(**batch)
+    return tokenizer.decode(generated[0], skip_special_tokens=True)
 
 
 class TranslatorGUI:
@@ -24,10 +67,12 @@ class TranslatorGUI:
         self.root.geometry("700x600")
         self.root.resizable(True, True)
         
-        # Initialize components
-        self.recognizer = sr.Recognizer()
-        self.translator = Translator()
-        pygame.mixer.init()
+        # Heavy components are created on the first Start click
+        self.recognizer = None
+        self.tts_engine = None
+        self.whisper_process = None
+        self.stt_in_q = None
+        self.stt_out_q = None
         
         # State
         self.is_running = False
@@ -35,13 +80,13 @@ class TranslatorGUI:
         
         # Queues
         self.text_queue = queue.Queue()
+        self.status_queue = queue.Queue()
         
         # Setup GUI
         self.setup_ui()
-        
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self.process_queue, daemon=True)
-        self.processing_thread.start()
+
+        # Drain queued log messages on the Tk main thread
+        self.root.after(50, self._drain_ui)
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -172,25 +217,64 @@ class TranslatorGUI:
         return selection.split('(')[1].rstrip(')')
     
     def log_message(self, message, tag="info"):
-        """Add message to output area"""
-        self.output_text.insert(tk.END, message + "\n")
-        self.output_text.see(tk.END)
-        self.root.update()
-    
+        """Queue a message for the output area (safe from any thread)"""
+        self.text_queue.put(message)
+
+    def _drain_ui(self):
+        """Batch all queued messages into one insert on the Tk main thread"""
+        messages = []
+        while True:
+            try:
+                messages.append(self.text_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if messages:
+            self.output_text.insert(tk.END, '\n'.join(messages) + '\n')
+            self.output_text.see(tk.END)
+
+        # Only the newest queued status matters
+        status = None
+        while True:
+            try:
+                status = self.status_queue.get_nowait()
+            except queue.Empty:
+                break
+        if status is not None:
+            self.status_label.config(text=status)
+
+        self.root.after(50, self._drain_ui)
+
     def clear_output(self):
         """Clear the output text area"""
         self.output_text.delete(1.0, tk.END)
     
     def update_status(self, message, color="#3498DB"):
-        """Update status label"""
-        self.status_label.config(text=message)
-        self.root.update()
-    
+        """Queue a status update for the label (safe from any thread)"""
+        self.status_queue.put(message)
+
+    def _ensure_backend(self):
+        """Import and initialize the speech/translation stack on first use"""
+        if self.recognizer is not None:
+            return
+
+        self.update_status("⏳ Loading speech engine...")
+        import speech_recognition as sr
+        import pyttsx3
+        import whisper_worker
+
+        self.recognizer = sr.Recognizer()
+        self.tts_engine = pyttsx3.init()
+
+        # Whisper runs in its own process, leaving this one to Tk
+        self.whisper_process, self.stt_in_q, self.stt_out_q = whisper_worker.start()
+
     def start_translation(self):
         """Start the translation process"""
         if self.is_running:
             return
-        
+
+        self._ensure_backend()
         self.is_running = True
         self.start_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
@@ -219,10 +303,67 @@ class TranslatorGUI:
         self.update_status("⚪ Stopped")
         self.log_message("\n🛑 Translation stopped\n")
     
+    def _select_voice(self, target_lang):
+        """
+        Point the pyttsx3 engine at an installed voice for the target
+        language. Returns True if one was found.
+        """
+        lang = target_lang.split('-')[0].lower()
+        for voice in self.tts_engine.getProperty('voices'):
+            tags = list(voice.languages or []) + [voice.id, voice.name or '']
+            for tag in tags:
+                if isinstance(tag, bytes):
+                    tag = tag.decode(errors='ignore')
+                # Match 'es' against tags like 'es', 'es_ES' or 'es-MX'
+                # without tripping on substrings of unrelated ids
+                if lang in re.split(r'[^a-z]+', str(tag).lower()):
+                    self.tts_engine.setProperty('voice', voice.id)
+                    return True
+        return False
+
+    def _stt_result(self):
+        """
+        Wait for the Whisper worker's transcript without hanging the GUI
+        if the worker process died (e.g. faster-whisper missing or the
+        model download failed).
+        """
+        while True:
+            try:
+                return self.stt_out_q.get(timeout=1)
+            except queue.Empty:
+                if not self.whisper_process.is_alive():
+                    raise RuntimeError(
+                        "Whisper worker exited — is faster-whisper installed?"
+                    )
+
     def listen_and_translate(self, source_lang, target_lang):
         """Listen and translate in a loop"""
-        
+        import numpy as np
+        import speech_recognition as sr
+
         try:
+            # Load the translation model up front so the first utterance
+            # doesn't pay for it
+            self.update_status("⏳ Loading translation model...")
+            try:
+                _get_marian(source_lang, target_lang)
+            except LookupError as e:
+                self.log_message(f"❌ {e}")
+                self.log_message("💡 Try a different language pair\n")
+                self.update_status("❌ Language pair unavailable")
+                # Button state is Tk work — hand it to the main thread
+                self.root.after(0, self.stop_translation)
+                return
+
+            # Speak with a voice that matches the target language — the
+            # OS default voice would garble anything non-English
+            if not self._select_voice(target_lang):
+                self.log_message(
+                    f"⚠️  No installed TTS voice matches '{target_lang}' — "
+                    "translations will be spoken with the default voice.\n"
+                    "💡 Install a system voice for the language to fix this\n"
+                )
+
             # Initialize microphone
             self.microphone = sr.Microphone()
             
@@ -243,39 +384,34 @@ class TranslatorGUI:
                         
                         self.update_status("🧠 Recognizing...")
                         self.log_message("🧠 Recognizing speech...")
-                        
-                        # Recognize
-                        text = self.recognizer.recognize_google(audio, language=source_lang)
+
+                        # Recognize in the Whisper worker process (local, no cloud)
+                        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+                        samples = np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+                        self.stt_in_q.put((samples, source_lang.split('-')[0]))
+                        text = self._stt_result()
+
+                        if not text:
+                            self.log_message("⚠️  Could not understand audio\n")
+                            self.update_status("⚠️  Couldn't understand - Try again")
+                            continue
+
                         self.log_message(f"📄 You said: '{text}'")
                         
-                        # Translate
+                        # Translate locally — deterministic latency, no network
                         self.update_status("🌍 Translating...")
                         self.log_message(f"🌍 Translating...")
-                        
-                        translation = self.translator.translate(text, src=source_lang, dest=target_lang)
-                        translated_text = translation.text
+
+                        translated_text = _translate_local(source_lang, target_lang, text)
                         self.log_message(f"✅ Translation: '{translated_text}'")
-                        
-                        # Speak
+
+                        # Speak with the local TTS engine
                         self.update_status("🔊 Speaking...")
                         self.log_message("🔊 Speaking translation...")
-                        
-                        tts = gTTS(text=translated_text, lang=target_lang, slow=False)
-                        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                            temp_file = fp.name
-                            tts.save(temp_file)
-                        
-                        pygame.mixer.music.load(temp_file)
-                        pygame.mixer.music.play()
-                        
-                        while pygame.mixer.music.get_busy():
-                            if not self.is_running:
-                                pygame.mixer.music.stop()
-                                break
-                        
-                        pygame.mixer.music.unload()
-                        os.unlink(temp_file)
-                        
+
+                        self.tts_engine.say(translated_text)
+                        self.tts_engine.runAndWait()
+
                         self.log_message("✅ Done!\n")
                         self.update_status("🎤 Ready - Speak again!")
                         
@@ -292,18 +428,9 @@ class TranslatorGUI:
         except Exception as e:
             self.log_message(f"❌ Fatal error: {e}\n")
             self.update_status("❌ Fatal error")
-            self.stop_translation()
+            # Button state is Tk work — hand it to the main thread
+            self.root.after(0, self.stop_translation)
     
-    def process_queue(self):
-        """Process messages from queue"""
-        while True:
-            try:
-                message = self.text_queue.get(timeout=0.1)
-                self.log_message(message)
-            except queue.Empty:
-                pass
-
-
 def main():
     """Main function to run the GUI"""
     root = tk.Tk()
@@ -4,19 +4,107 @@ Truly continuous: Listens -> Recognizes -> Translates -> Speaks
 NEVER stops listening - captures EVERY 3 seconds of audio
 """
 
-import speech_recognition as sr
+import asyncio
+import collections
+import concurrent.futures
+import json
 from googletrans import Translator
 from gtts import gTTS
+from pydub import AudioSegment
 import os
-import tempfile
 import pygame
 import threading
 import queue
 import time
 from datetime import datetime
+import numpy as np
 import pyaudio
 import wave
 import io
+import webrtcvad
+
+# Optional low-latency streaming TTS; gTTS remains the fallback
+try:
+    from elevenlabs.client import ElevenLabs
+    from elevenlabs import stream as play_audio_stream
+except ImportError:
+    ElevenLabs = None
+
+# Optional streaming STT over a persistent WebSocket; local Whisper
+# remains the fallback
+try:
+    import websocket
+    from websocket import ABNF
+except ImportError:
+    websocket = None
+
+# Optional numba fast path for the hot audio copy; numpy slice
+# assignment is the fallback
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _copy_samples(dst, offset, src):
+    """Copy src samples into dst at offset; returns the new offset"""
+    dst[offset:offset + src.shape[0]] = src
+    return offset + src.shape[0]
+
+
+if njit is not None:
+    # Compiled with nogil so the per-frame segment write runs outside
+    # the GIL and can't be preempted by the other pipeline threads
+    _copy_samples = njit(nogil=True, cache=True)(_copy_samples)
+
+
+# Bounded LRU caches: conversational speech repeats short phrases
+# ("yes", "okay, thanks"), and a repeat costs a dict hit instead of a
+# network round-trip. Keys carry the language pair so switching
+# languages never serves stale entries.
+_translation_cache = collections.OrderedDict()
+_tts_cache = collections.OrderedDict()
+_TRANSLATION_CACHE_MAX = 1024
+_TTS_CACHE_MAX = 64  # raw PCM entries are big, so the bound is tight
+
+
+def _cache_get(cache, key):
+    """Return the cached value (refreshing its recency) or None"""
+    try:
+        cache.move_to_end(key)
+        return cache[key]
+    except KeyError:
+        return None
+
+
+def _cache_put(cache, key, value, maxsize):
+    """Insert a value, evicting the least recently used past maxsize"""
+    cache[key] = value
+    cache.move_to_end(key)
+    if len(cache) > maxsize:
+        cache.popitem(last=False)
+
+
+# Sample rate the mixer is opened at; synthesized audio is resampled to
+# it in the worker so playback is a straight PCM hand-off
+_TTS_PCM_RATE = 24000
+
+
+def _synthesize_pcm(text, lang):
+    """
+    Synthesize one phrase to raw 16-bit mono PCM with gTTS.
+    Module-level so it can run in a worker process — synthesis and the
+    MP3 decode both happen outside this interpreter's GIL, so playback
+    never decodes on the critical path.
+    """
+    tts = gTTS(text=text, lang=lang, slow=False)
+    buf = io.BytesIO()
+    tts.write_to_fp(buf)
+    buf.seek(0)
+
+    segment = AudioSegment.from_mp3(buf)
+    segment = segment.set_frame_rate(_TTS_PCM_RATE).set_channels(1).set_sample_width(2)
+    return segment.raw_data
 
 
 class RealtimeTranslator:
@@ -25,22 +113,56 @@ class RealtimeTranslator:
     Uses background audio recording to capture EVERY chunk without missing any audio.
     """
     
-    def __init__(self, source_lang='en', target_lang='es', chunk_duration=3):
+    def __init__(self, source_lang='en', target_lang='es', chunk_duration=3, max_batch=8):
         """
         Initialize the translator
-        
+
         Args:
             source_lang (str): Source language code (e.g., 'en' for English)
             target_lang (str): Target language code (e.g., 'es' for Spanish)
-            chunk_duration (int): Duration in seconds to capture before processing
+            chunk_duration (int): Max seconds in a single speech segment
+            max_batch (int): Max queued texts translated in one API call
         """
         self.source_lang = source_lang
         self.target_lang = target_lang
         self.chunk_duration = chunk_duration
+        self.max_batch = max_batch
         
-        # Initialize components
-        self.recognizer = sr.Recognizer()
-        self.translator = Translator()
+        # The Translator client lives on the translate stage's event loop
+        # (see _translate_loop), so its HTTP connections stay pooled there
+
+        # Streaming STT (optional): one persistent WebSocket gets audio
+        # frames as they are captured and pushes transcripts back the
+        # moment a turn ends — no per-chunk upload, no waiting for a
+        # whole segment
+        self._streaming_stt = (websocket is not None
+                               and bool(os.environ.get('ASSEMBLYAI_API_KEY')))
+        self._ws = None
+
+        # Concurrent Whisper passes in flight before recognition applies
+        # backpressure; results are still emitted in utterance order
+        self._stt_workers = 4
+
+        self.stt_pipeline = None
+        if self._streaming_stt:
+            print("✅ Streaming STT enabled (AssemblyAI)")
+        else:
+            # Local Whisper pipeline, loaded once and reused for every
+            # chunk: no per-chunk network round-trip, and the forward pass
+            # releases the GIL so the other stages keep moving
+            import torch
+            from transformers import pipeline
+
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+            model = 'openai/whisper-large-v3-turbo' if device == 'cuda' else 'openai/whisper-tiny'
+            print(f"🤖 Loading Whisper model '{model}' on {device}...")
+            self.stt_pipeline = pipeline(
+                'automatic-speech-recognition',
+                model=model,
+                torch_dtype=torch.float16 if device == 'cuda' else torch.float32,
+                device=device,
+                chunk_length_s=10
+            )
         
         # Audio settings
         self.CHUNK = 1024
@@ -48,43 +170,186 @@ class RealtimeTranslator:
         self.CHANNELS = 1
         self.RATE = 16000
         
-        # Initialize pygame for audio playback
-        pygame.mixer.init()
+        # Initialize pygame for audio playback. The event queue needs the
+        # video subsystem, so bring it up on the dummy driver (headless);
+        # the end-of-track event lets playback waits block instead of poll
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        pygame.display.init()
+        pygame.mixer.init(frequency=_TTS_PCM_RATE, size=-16, channels=1)
+        self._music_end = pygame.USEREVENT + 1
+        self._channel = pygame.mixer.Channel(0)
+        self._channel.set_endevent(self._music_end)
+
+        # Streaming TTS client (optional): playback starts on the first
+        # audio chunk instead of after full synthesis
+        self._tts_client = None
+        if ElevenLabs is not None and os.environ.get('ELEVENLABS_API_KEY'):
+            self._tts_client = ElevenLabs()
+            print("✅ Streaming TTS enabled (ElevenLabs)")
         
-        # Queues for managing translation pipeline
-        self.audio_queue = queue.Queue(maxsize=10)  # Limit queue size
-        self.text_queue = queue.Queue()
-        self.translation_queue = queue.Queue()
-        self.speech_queue = queue.Queue()
+        # Recognize/translate/speak share one asyncio event loop (see
+        # _pipeline); their queues are created once that loop starts
+        self._loop = None
+        self._audio_queue = None
+        self._text_queue = None
+        self._translation_queue = None
         
         # Control flags
         self.is_running = False
-        
-        # Audio buffer for continuous recording
-        self.audio_frames = []
-        self.lock = threading.Lock()
-        
+
+        # VAD-gated chunking: a chunk is emitted when a voiced segment
+        # ends, so chunks align to speech instead of a fixed timer and
+        # silent stretches never reach the recognizer at all.
+        # chunk_duration now caps a single segment — speech running past
+        # it is emitted and accumulation continues seamlessly.
+        self._chunk_samples = self.RATE * self.chunk_duration  # int16 mono
+        self._vad = webrtcvad.Vad(2)
+        self._frame_bytes = (self.RATE // 50) * 2  # one 20 ms VAD frame
+
+        # Lock-free handoff from PortAudio's real-time thread: SimpleQueue
+        # is a reentrant C put on the producer side (never blocks the
+        # audio thread) and gives the chunker a blocking get, so the
+        # consumer wakes on arrival instead of sleep-polling
+        self._frames = queue.SimpleQueue()
+        self._pre_roll = collections.deque(maxlen=15)  # ~300 ms before onset
+        self._vad_pending = bytearray()  # callback bytes awaiting framing
+
+        # Segment audio lives in one preallocated int16 array; the VAD
+        # frames are written straight in and the finished segment goes
+        # downstream as an ndarray — no per-chunk join/parse of bytes
+        self._segment_buf = np.empty(self._chunk_samples, dtype=np.int16)
+        self._seg_len = 0
+        self._in_speech = False
+        self._silence_frames = 0
+        self._max_silence_frames = 20  # 400 ms of silence closes a segment
+        self._chunk_number = 0
+
+        # PyAudio handles, opened by start()
+        self._audio = None
+        self._stream = None
+
+        # TTS synthesis runs in worker processes so it never competes for
+        # this interpreter's GIL with capture/recognition
+        self._pool = concurrent.futures.ProcessPoolExecutor(max_workers=2)
+
+        # Warm the synthesis path in the background: worker spawn and
+        # gTTS's first-call setup happen now, not on the first phrase.
+        # (The translate client warms itself when its loop starts.)
+        warm = self._pool.submit(_synthesize_pcm, 'hi', self.target_lang)
+        warm.add_done_callback(lambda f: f.exception())  # ok to fail offline
+
         print("✅ Translator initialized!")
-        
+
     def audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for continuous audio recording"""
+        """
+        Callback for continuous audio recording.
+        Runs on PortAudio's real-time thread, so it does exactly one
+        non-blocking put — no locks, no VAD work, no jitter.
+        """
         if self.is_running:
-            with self.lock:
-                self.audio_frames.append(in_data)
+            self._frames.put(in_data)
         return (in_data, pyaudio.paContinue)
+
+    def chunk_audio(self):
+        """
+        Stage 1b: SEGMENTING
+        Drain callback buffers from the handoff queue, re-frame them into
+        the 20 ms frames the VAD expects, and run the segmenting state
+        machine.
+        """
+        while self.is_running:
+            try:
+                data = self._frames.get(timeout=1)
+            except queue.Empty:
+                continue
+
+            if self._streaming_stt:
+                # Frames go straight onto the socket; the server does its
+                # own turn detection, so the local VAD machine is bypassed
+                self._send_stt_frame(data)
+                continue
+
+            self._vad_pending.extend(data)
+            n = self._frame_bytes
+            usable = len(self._vad_pending) - (len(self._vad_pending) % n)
+            if not usable:
+                continue
+
+            # Frames are zero-copy views into the pending buffer: the VAD
+            # and the segment write both read through the view, so the
+            # only copy left on this path is the segment-array write
+            with memoryview(self._vad_pending) as mv:
+                for offset in range(0, usable, n):
+                    self._process_frame(mv[offset:offset + n])
+            del self._vad_pending[:usable]
+
+    def _append_samples(self, frame):
+        """Vector-copy one frame's samples into the segment array"""
+        samples = np.frombuffer(frame, np.int16)
+        self._seg_len = _copy_samples(self._segment_buf, self._seg_len, samples)
+
+    def _process_frame(self, frame):
+        """Feed one 20 ms frame through the VAD state machine"""
+        voiced = self._vad.is_speech(frame, self.RATE)
+
+        if not self._in_speech:
+            # Idle: keep a short pre-roll so segment starts aren't clipped.
+            # Materialize the view — the pending buffer it points into is
+            # recycled as soon as the batch of frames is processed.
+            self._pre_roll.append(bytes(frame))
+            if voiced:
+                self._seg_len = 0
+                while self._pre_roll:
+                    self._append_samples(self._pre_roll.popleft())
+                self._in_speech = True
+                self._silence_frames = 0
+            return
+
+        self._append_samples(frame)
+
+        if voiced:
+            self._silence_frames = 0
+        else:
+            self._silence_frames += 1
+            if self._silence_frames >= self._max_silence_frames:
+                # Sustained silence: the utterance is over
+                self._emit_chunk()
+                self._in_speech = False
+                return
+
+        if self._seg_len + self._frame_bytes // 2 > self._chunk_samples:
+            # Cap a runaway segment; accumulation continues seamlessly
+            self._emit_chunk()
+
+    def _emit_chunk(self):
+        """Hand the accumulated speech segment to the asyncio pipeline"""
+        self._chunk_number += 1
+        seconds = self._seg_len / self.RATE
+        if self._loop is not None:
+            chunk = self._segment_buf[:self._seg_len].copy()
+            self._loop.call_soon_threadsafe(self._enqueue_audio, chunk)
+            print(f"📝 Chunk #{self._chunk_number} captured ({seconds:.1f}s)")
+        self._seg_len = 0
+
+    def _enqueue_audio(self, chunk):
+        """Runs on the event loop; drops the chunk if recognition lags"""
+        try:
+            self._audio_queue.put_nowait(chunk)
+        except asyncio.QueueFull:
+            print(f"⚠️  Queue full, skipping chunk #{self._chunk_number}")
     
-    def continuous_audio_capture(self):
+    def _start_stream(self):
         """
         Stage 1: CONTINUOUS LISTENING
-        Records audio continuously in background and splits into chunks every N seconds
-        This NEVER stops, so no audio is missed!
+        Open the PyAudio stream; PortAudio's own thread drives the callback,
+        which emits a chunk whenever a voiced segment ends. No polling thread.
         """
-        print(f"\n🎤 Starting continuous audio capture ({self.chunk_duration}s chunks)...")
-        
-        audio = pyaudio.PyAudio()
-        
+        print(f"\n🎤 Starting continuous audio capture (VAD-gated chunks)...")
+
+        self._audio = pyaudio.PyAudio()
+
         # Open audio stream with callback
-        stream = audio.open(
+        self._stream = self._audio.open(
             format=self.FORMAT,
             channels=self.CHANNELS,
             rate=self.RATE,
@@ -92,143 +357,318 @@ class RealtimeTranslator:
             frames_per_buffer=self.CHUNK,
             stream_callback=self.audio_callback
         )
-        
-        stream.start_stream()
+
+        self._stream.start_stream()
         print(f"✅ Continuous recording started! Speak in {self.source_lang.upper()}...\n")
-        
-        # Calculate frames per chunk
-        frames_per_chunk = int(self.RATE / self.CHUNK * self.chunk_duration)
-        
-        chunk_number = 0
-        
-        while self.is_running:
-            time.sleep(self.chunk_duration)  # Wait for chunk duration
-            
-            # Get accumulated frames
-            with self.lock:
-                if len(self.audio_frames) > 0:
-                    chunk_number += 1
-                    
-                    # Take all accumulated frames as one chunk
-                    audio_chunk = b''.join(self.audio_frames)
-                    self.audio_frames = []  # Clear for next chunk
-                    
-                    if len(audio_chunk) > 0:
-                        # Convert to AudioData format
-                        audio_data = sr.AudioData(audio_chunk, self.RATE, 2)
-                        
-                        # Add to queue (non-blocking)
-                        try:
-                            self.audio_queue.put_nowait(audio_data)
-                            print(f"📝 Chunk #{chunk_number} captured ({self.chunk_duration}s)")
-                        except queue.Full:
-                            print(f"⚠️  Queue full, skipping chunk #{chunk_number}")
-        
-        # Cleanup
-        stream.stop_stream()
-        stream.close()
-        audio.terminate()
+
+    def _stop_stream(self):
+        """Close the PyAudio stream"""
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+            self._stream = None
+        if self._audio is not None:
+            self._audio.terminate()
+            self._audio = None
         print("🛑 Audio capture stopped")
-        
-    def recognize_speech(self):
+
+    def _start_streaming_stt(self):
+        """Open the persistent STT WebSocket and its reader thread"""
+        url = ('wss://streaming.assemblyai.com/v3/ws'
+               f'?sample_rate={self.RATE}&format_turns=true')
+
+        def on_message(ws, message):
+            try:
+                data = json.loads(message)
+            except ValueError:
+                return
+            if data.get('type') == 'Turn' and data.get('end_of_turn'):
+                text = data.get('transcript', '').strip()
+                if text:
+                    print(f"  📄 You said: '{text}'")
+                    self._submit_text(text)
+
+        def on_error(ws, error):
+            print(f"  ❌ Streaming STT error: {error}")
+
+        self._ws = websocket.WebSocketApp(
+            url,
+            header={'Authorization': os.environ['ASSEMBLYAI_API_KEY']},
+            on_message=on_message,
+            on_error=on_error
+        )
+        threading.Thread(target=self._ws.run_forever, name="STTSocket",
+                         daemon=True).start()
+
+    def _send_stt_frame(self, data):
+        """Push one captured buffer onto the STT socket"""
+        if self._ws is None or self._ws.sock is None:
+            return
+        try:
+            self._ws.send(data, opcode=ABNF.OPCODE_BINARY)
+        except Exception as e:
+            print(f"  ❌ Streaming STT send error: {e}")
+
+    def _submit_text(self, text):
+        """Hand recognized text to the asyncio stages from a plain thread"""
+        if self._loop is None:
+            return
+        self._loop.call_soon_threadsafe(self._enqueue_text, text)
+
+    def _enqueue_text(self, text):
+        """Runs on the event loop; drops text if translation is saturated"""
+        try:
+            self._text_queue.put_nowait(text)
+        except asyncio.QueueFull:
+            print("⚠️  Translation backlog full, dropping text")
+
+    def _run_pipeline(self):
+        """Thread entry point hosting the asyncio pipeline stages"""
+        asyncio.run(self._pipeline())
+
+    async def _pipeline(self):
+        """
+        Stages 2-4 on a single event loop. One scheduler thread replaces
+        three queue-polling threads: blocking work (Whisper, playback)
+        runs via asyncio.to_thread or the process pool, and network calls
+        overlap naturally with asyncio.gather.
+        """
+        self._audio_queue = asyncio.Queue(maxsize=10)
+        self._text_queue = asyncio.Queue(maxsize=10)
+        self._translation_queue = asyncio.Queue(maxsize=10)
+        self._loop = asyncio.get_running_loop()
+
+        await asyncio.gather(
+            self._recognize_loop(),
+            self._translate_loop(),
+            self._speak_loop(),
+        )
+
+    async def _recognize_loop(self):
         """
         Stage 2: UNDERSTANDING
-        Convert audio to text using speech recognition
-        Runs in parallel with audio capture!
+        Convert audio to text using speech recognition.
+        Up to _stt_workers chunks transcribe concurrently so a slow pass
+        doesn't compound the backlog; the ordered deque of tasks means
+        transcripts still come out in utterance order.
         """
+        pending = collections.deque()
         while self.is_running:
+            # Emit finished transcripts, oldest first
+            while pending and pending[0].done():
+                await self._emit_transcript(pending.popleft())
+
+            if len(pending) >= self._stt_workers:
+                # Saturated: block on the oldest pass before taking more
+                await self._emit_transcript(pending.popleft())
+                continue
+
             try:
-                # Get audio from queue (with timeout)
-                audio_data = self.audio_queue.get(timeout=1)
-                
-                # Recognize speech
-                print("  🧠 Recognizing speech...")
-                text = self.recognizer.recognize_google(
-                    audio_data, 
-                    language=self.source_lang
-                )
-                
-                if text:
-                    print(f"  📄 You said: '{text}'")
-                    self.text_queue.put(text)
-                    
-            except queue.Empty:
+                chunk = await asyncio.wait_for(self._audio_queue.get(), timeout=1)
+            except asyncio.TimeoutError:
                 continue
-            except sr.UnknownValueError:
-                print("  ⚠️  Could not understand audio (silent or unclear)")
-            except sr.RequestError as e:
-                print(f"  ❌ Recognition API error: {e}")
-            except Exception as e:
-                print(f"  ❌ Recognition error: {e}")
-                
-    def translate_text(self):
+
+            # Recognize speech locally with Whisper; each forward pass
+            # runs off-loop so translate/speak stay responsive
+            print("  🧠 Recognizing speech...")
+            samples = chunk.astype(np.float32) / 32768.0
+            pending.append(asyncio.create_task(asyncio.to_thread(
+                self.stt_pipeline, {'sampling_rate': self.RATE, 'raw': samples}
+            )))
+
+        for task in pending:
+            await self._emit_transcript(task)
+
+    async def _emit_transcript(self, task):
+        """Await one transcription task and queue its text"""
+        try:
+            result = await task
+            text = result['text'].strip()
+
+            if text:
+                print(f"  📄 You said: '{text}'")
+                await self._text_queue.put(text)
+            else:
+                print("  ⚠️  No speech detected in chunk")
+
+        except Exception as e:
+            print(f"  ❌ Recognition error: {e}")
+
+    async def _translate_loop(self):
         """
         Stage 3: TRANSLATING
-        Translate recognized text to target language
-        Runs in parallel!
+        Translate recognized text to target language.
+        Pending texts are dispatched as concurrent HTTP requests, so N
+        waiting chunks cost one RTT instead of N.
         """
-        while self.is_running:
+        # One client for the life of the loop: HTTP/2 with keep-alive, so
+        # steady-state requests reuse the pooled connection instead of
+        # paying a TLS handshake per chunk
+        async with Translator(timeout=10) as translator:
             try:
-                # Get text from queue
-                text = self.text_queue.get(timeout=1)
-                
-                # Translate
-                print(f"  🌍 Translating to {self.target_lang.upper()}...")
-                translation = self.translator.translate(
-                    text, 
-                    src=self.source_lang, 
-                    dest=self.target_lang
+                # Warm the connection now — the handshake happens during
+                # startup, not on the first spoken phrase
+                await translator.translate(
+                    'hello', src=self.source_lang, dest=self.target_lang
                 )
+            except Exception:
+                pass
+
+            while self.is_running:
+                try:
+                    texts = [await asyncio.wait_for(self._text_queue.get(), timeout=1)]
+                except asyncio.TimeoutError:
+                    continue
+
+                while len(texts) < self.max_batch:
+                    try:
+                        texts.append(self._text_queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+
+                try:
+                    # Serve repeats from the cache; only misses go on the wire
+                    results = [None] * len(texts)
+                    misses = []
+                    for i, text in enumerate(texts):
+                        key = (self.source_lang, self.target_lang, text)
+                        cached = _cache_get(_translation_cache, key)
+                        if cached is not None:
+                            results[i] = cached
+                        else:
+                            misses.append(i)
+
+                    if misses:
+                        # All miss requests are in flight at once
+                        print(f"  🌍 Translating {len(misses)} phrase(s) to {self.target_lang.upper()}...")
+                        translations = await asyncio.gather(*(
+                            translator.translate(
+                                texts[i],
+                                src=self.source_lang,
+                                dest=self.target_lang
+                            )
+                            for i in misses
+                        ))
+                        for i, translation in zip(misses, translations):
+                            results[i] = translation.text
+                            _cache_put(
+                                _translation_cache,
+                                (self.source_lang, self.target_lang, texts[i]),
+                                translation.text,
+                                _TRANSLATION_CACHE_MAX
+                            )
+
+                    for translated_text in results:
+                        print(f"  ✅ Translation: '{translated_text}'")
+                        await self._translation_queue.put(translated_text)
+
+                except Exception as e:
+                    print(f"  ❌ Translation error: {e}")
                 
-                translated_text = translation.text
-                print(f"  ✅ Translation: '{translated_text}'")
-                
-                self.translation_queue.put(translated_text)
-                
-            except queue.Empty:
-                continue
-            except Exception as e:
-                print(f"  ❌ Translation error: {e}")
-                
-    def speak_translation(self):
+    def _speak_streaming(self, text):
+        """
+        Stream synthesized audio and start playback on first-chunk arrival.
+        Returns False on failure so the caller can fall back to gTTS
+        (e.g. for languages the streaming provider doesn't cover).
+        """
+        try:
+            audio_stream = self._tts_client.text_to_speech.stream(
+                text=text,
+                voice_id=os.environ.get('ELEVENLABS_VOICE_ID', 'JBFqnCBsd6RMkjVDRZzb'),
+                model_id='eleven_flash_v2_5',
+                optimize_streaming_latency=4,
+                output_format='mp3_22050_32'
+            )
+            play_audio_stream(audio_stream)
+            return True
+        except Exception as e:
+            print(f"  ⚠️  Streaming TTS failed ({e}), falling back to gTTS")
+            return False
+
+    def _tts_audio_for(self, text):
+        """
+        Return cached PCM bytes for a phrase, or a Future synthesizing
+        them in the worker pool on a miss.
+        """
+        cached = _cache_get(_tts_cache, (self.target_lang, text))
+        if cached is not None:
+            return cached
+        return self._pool.submit(_synthesize_pcm, text, self.target_lang)
+
+    async def _speak_loop(self):
         """
         Stage 4: SPEAKING
         Convert translated text to speech and play it
         Runs in parallel - audio capture continues while speaking!
         """
-        while self.is_running or not self.translation_queue.empty():
+        while self.is_running or not self._translation_queue.empty():
             try:
-                # Get translated text from queue
-                text = self.translation_queue.get(timeout=1)
-                
-                print(f"  🔊 Speaking: '{text}'")
-                
-                # Generate speech
-                tts = gTTS(text=text, lang=self.target_lang, slow=False)
-                
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as fp:
-                    temp_file = fp.name
-                    tts.save(temp_file)
-                
-                # Play audio (this doesn't block audio capture!)
-                pygame.mixer.music.load(temp_file)
-                pygame.mixer.music.play()
-                
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-                
-                # Clean up
-                pygame.mixer.music.unload()
-                os.unlink(temp_file)
-                
-                print("  ✅ Speech complete\n")
-                
-            except queue.Empty:
+                text = await asyncio.wait_for(self._translation_queue.get(), timeout=1)
+            except asyncio.TimeoutError:
                 continue
-            except Exception as e:
-                print(f"  ❌ Speech error: {e}")
+
+            # Without a streaming client, submit every pending phrase to
+            # the synthesis pool up front and play in order — chunk N+1
+            # synthesizes while N plays; repeats come straight from the
+            # cache. With a streaming client, synthesis is deferred until
+            # streaming actually fails, so no fetch is wasted.
+            prefetch = self._tts_client is None
+            pending = [(text, self._tts_audio_for(text) if prefetch else None)]
+            while True:
+                try:
+                    text = self._translation_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                pending.append((text, self._tts_audio_for(text) if prefetch else None))
+
+            for text, audio in pending:
+                try:
+                    print(f"  🔊 Speaking: '{text}'")
+
+                    # Prefer streaming TTS: first audio plays while the rest
+                    # is still synthesizing
+                    if self._tts_client is not None and \
+                            await asyncio.to_thread(self._speak_streaming, text):
+                        print("  ✅ Speech complete\n")
+                        continue
+
+                    # Fallback: play the worker-synthesized gTTS audio
+                    # straight from memory — no temp file, no unlink
+                    if audio is None:
+                        audio = self._tts_audio_for(text)
+                    if isinstance(audio, bytes):
+                        pcm_bytes = audio
+                    else:
+                        pcm_bytes = await asyncio.wrap_future(audio)
+                        _cache_put(
+                            _tts_cache,
+                            (self.target_lang, text),
+                            pcm_bytes,
+                            _TTS_CACHE_MAX
+                        )
+
+                    # Playback blocks in a worker thread; the loop keeps
+                    # translating and synthesizing meanwhile
+                    await asyncio.to_thread(self._play_pcm, pcm_bytes)
+
+                    print("  ✅ Speech complete\n")
+
+                except Exception as e:
+                    print(f"  ❌ Speech error: {e}")
+
+    def _play_pcm(self, pcm_bytes):
+        """Play pre-decoded PCM from memory and block until playback ends"""
+        # Sound wraps the buffer directly — no decode at play time
+        sound = pygame.mixer.Sound(buffer=pcm_bytes)
+        self._channel.play(sound)
+
+        # Block until the end-of-track event arrives — one wake at track
+        # end, not ten per second (the timeout is only a guard against a
+        # lost event)
+        while self._channel.get_busy():
+            event = pygame.event.wait(500)
+            if event.type == self._music_end:
+                break
                 
     def start(self, duration=None):
         """
@@ -242,19 +682,24 @@ class RealtimeTranslator:
         print("="*70)
         print(f"📥 Source Language: {self.source_lang.upper()}")
         print(f"📤 Target Language: {self.target_lang.upper()}")
-        print(f"⏱️  Chunk Duration: {self.chunk_duration}s")
+        print(f"⏱️  Max Segment Length: {self.chunk_duration}s")
         print(f"🎯 Mode: TRULY CONTINUOUS - No audio is missed!")
         print("="*70)
         print("\n⚡ Starting streaming translation pipeline...\n")
         
         self.is_running = True
-        
-        # Create threads for each stage of the pipeline
+
+        if self._streaming_stt:
+            self._start_streaming_stt()
+
+        # Capture is driven by the PortAudio callback, not a thread of ours
+        self._start_stream()
+
+        # The chunker gets a thread; recognize/translate/speak all live
+        # on the single event loop hosted by the Pipeline thread
         threads = [
-            threading.Thread(target=self.continuous_audio_capture, name="AudioCapture", daemon=True),
-            threading.Thread(target=self.recognize_speech, name="Recognizer", daemon=True),
-            threading.Thread(target=self.translate_text, name="Translator", daemon=True),
-            threading.Thread(target=self.speak_translation, name="Speaker", daemon=True)
+            threading.Thread(target=self.chunk_audio, name="Chunker", daemon=True),
+            threading.Thread(target=self._run_pipeline, name="Pipeline", daemon=True)
         ]
         
         # Start all threads
@@ -264,7 +709,7 @@ class RealtimeTranslator:
         
         print("\n" + "="*70)
         print("🎯 System ready! Speak continuously...")
-        print("📊 Every 3 seconds will be captured and translated")
+        print("📊 Each pause ends a segment, which is translated immediately")
         print("🔄 While translating, audio capture continues!")
         print("💡 Press Ctrl+C to stop")
         print("="*70 + "\n")
@@ -287,11 +732,18 @@ class RealtimeTranslator:
     def stop(self):
         """Stop the translation system"""
         self.is_running = False
-        
+        self._stop_stream()
+
+        if self._ws is not None:
+            self._ws.close()
+            self._ws = None
+
         # Wait a bit for queues to empty
         print("⏳ Processing remaining items...")
         time.sleep(3)
-        
+
+        self._pool.shutdown(wait=False)
+
         print("✅ Translation system stopped")
         print("\n" + "="*70)
 
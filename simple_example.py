@@ -3,6 +3,7 @@ Simple Example - Quick Start Real-time Translator
 Minimal version for testing and learning
 """
 
+import asyncio
 import speech_recognition as sr
 from googletrans import Translator
 from gtts import gTTS
@@ -11,6 +12,12 @@ import os
 import tempfile
 
 
+async def _translate_once(text, source_lang, target_lang):
+    """One round-trip through googletrans' async client"""
+    async with Translator() as translator:
+        return await translator.translate(text, src=source_lang, dest=target_lang)
+
+
 def simple_translate(source_lang='en', target_lang='es'):
     """
     Simplified one-shot translation
@@ -19,7 +26,6 @@ def simple_translate(source_lang='en', target_lang='es'):
     
     # Initialize components
     recognizer = sr.Recognizer()
-    translator = Translator()
     pygame.mixer.init()
     
     print("\n" + "="*50)
@@ -47,7 +53,7 @@ def simple_translate(source_lang='en', target_lang='es'):
             
             # Translate
             print(f"🌍 Translating to {target_lang.upper()}...")
-            translation = translator.translate(text, src=source_lang, dest=target_lang)
+            translation = asyncio.run(_translate_once(text, source_lang, target_lang))
             translated_text = translation.text
             print(f"✅ Translation: '{translated_text}'\n")
             
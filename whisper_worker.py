@@ -0,0 +1,68 @@
+"""
+Whisper Worker Process
+Hosts a single faster-whisper model in its own process so the GUI and CLI
+frontends can transcribe on all cores without fighting the Python GIL
+"""
+
+import multiprocessing as mp
+import os
+
+
+def run(in_q, out_q, model_size='base'):
+    """
+    Worker loop: read (float32 audio array, language) pairs from in_q and
+    put the transcript for each on out_q. A None item shuts the worker down.
+    """
+    # A startup failure (missing faster-whisper, model download error)
+    # ends the process; the parent detects death via is_alive rather
+    # than blocking forever on the result queue
+    try:
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = 'cuda', 'float16'
+        else:
+            device, compute_type = 'cpu', 'int8'
+
+        model = WhisperModel(
+            model_size,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=os.cpu_count()
+        )
+    except Exception as e:
+        print(f"❌ Whisper worker failed to start: {e}")
+        return
+
+    while True:
+        item = in_q.get()
+        if item is None:
+            break
+
+        audio, language = item
+        try:
+            segments, info = model.transcribe(
+                audio,
+                language=language,
+                vad_filter=True,
+                beam_size=1
+            )
+            out_q.put(' '.join(segment.text.strip() for segment in segments).strip())
+        except Exception as e:
+            print(f"❌ Worker transcription error: {e}")
+            out_q.put('')
+
+
+def start(model_size='base'):
+    """
+    Spawn the worker process.
+
+    Returns:
+        tuple: (process, in_q, out_q)
+    """
+    in_q = mp.Queue()
+    out_q = mp.Queue()
+    process = mp.Process(target=run, args=(in_q, out_q, model_size), daemon=True)
+    process.start()
+    return process, in_q, out_q